@@ -5,15 +5,21 @@
     Definition of the token base class for use in Flask applications.
 """
 
+from typing import Any
 from typing import cast
 from typing import Iterable
+from typing import List
 from typing import Optional
+from typing import Set
+from typing import Tuple
 from typing import Type
 from typing import TypeVar
 from typing import Union
 
 from datetime import datetime
 from datetime import timedelta
+from functools import lru_cache
+from time import time
 from warnings import warn
 
 from easyjwt import EasyJWT
@@ -25,6 +31,17 @@ FlaskEasyJWTClass = TypeVar('FlaskEasyJWTClass', bound='FlaskEasyJWT', covariant
     The type of the :class:`.FlaskEasyJWT` class, allowing subclasses.
 """
 
+_INVALID_VALIDITY_MESSAGE = ('EASYJWT_TOKEN_VALIDITY must be an int, a string castable to an int, or a '
+                             'datetime.timedelta.')
+"""
+    The warning issued if the token validity in the application's configuration has an invalid value.
+"""
+
+_NO_KEY_MESSAGE = 'No key set for encrypting tokens. Set EASYJWT_KEY or SECRET_KEY.'
+"""
+    The error message if there is no key in the application's configuration.
+"""
+
 
 class FlaskEasyJWT(EasyJWT):
     """
@@ -133,6 +150,35 @@ class FlaskEasyJWT(EasyJWT):
 
         return cast(FlaskEasyJWTClass, super().verify(token, key, issuer, audience))
 
+    @classmethod
+    def verify_many(cls: Type[FlaskEasyJWTClass],
+                    tokens: Iterable[str],
+                    key: Optional[str] = None,
+                    issuer: Optional[str] = None,
+                    audience: Optional[Union[Iterable[str], str]] = None
+                    ) -> List[FlaskEasyJWTClass]:
+        """
+            Verify all given JSON Web Tokens.
+
+            This is the same as calling :meth:`verify` for each token, but the key is determined only once for all
+            tokens. The verification stops at the first token that cannot be verified.
+
+            :param tokens: The JWTs to verify.
+            :param key: The key used for decoding the tokens. This key must be the same with which the tokens have been
+                        created. If left empty, the key set in the application's configuration will be used.
+            :param issuer: The issuer of the tokens to verify.
+            :param audience: The audience for which the tokens are intended.
+            :return: The objects representing the tokens, in the order of the given tokens.
+            :raise EasyJWTError: If no key is given and there is no key defined in the application's configuration.
+                                 Otherwise, any error raised by :meth:`verify` for the first token that cannot be
+                                 verified.
+        """
+
+        if key is None:
+            key = cls._get_config_key()
+
+        return [cls.verify(token, key, issuer, audience) for token in tokens]
+
     # endregion
 
     # region Configuration Values
@@ -157,26 +203,46 @@ class FlaskEasyJWT(EasyJWT):
         if validity is None:
             return None
 
+        # If the validity already is a timedelta object, there is nothing to convert.
+        if isinstance(validity, timedelta):
+            return validity
+
+        # Strings and integers have to be converted. Since the configuration rarely changes, earlier conversions are
+        # reused. Values of any other type are invalid.
+        converted_validity: Optional[timedelta] = None
+        if isinstance(validity, (int, str)):
+            converted_validity = FlaskEasyJWT._convert_validity(validity)
+
+        # If the validity could not be converted to a timedelta object, issue a warning.
+        if converted_validity is None:
+            FlaskEasyJWT._warn_once(_INVALID_VALIDITY_MESSAGE, validity)
+            return None
+
+        return converted_validity
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _convert_validity(validity: Union[int, str]) -> Optional[timedelta]:
+        """
+            Convert the given token validity from the application's configuration to a `timedelta` object.
+
+            The results are cached so that each configured value only has to be converted once.
+
+            :param validity: The token's validity in seconds, either as an integer or as a string castable to an
+                             integer.
+            :return: `None` if the validity is a string that cannot be parsed to an integer. A `timedelta` object of
+                     the given length otherwise.
+        """
+
         # If the validity is specified as a string, convert it to an integer.
         if isinstance(validity, str):
             try:
                 validity = int(validity)
             except ValueError:
                 # If the string cannot be parsed to an integer, the validity is invalid.
-                # In this case, let the validity as is; the following checks will fail as well,
-                # and thus, a warning will be issued without having to duplicate the warning code.
-                pass
-
-        # If the validity is specified as an integer or has been parsed to one, convert it to a timedelta object.
-        if isinstance(validity, int):
-            validity = timedelta(seconds=validity)
-
-        # If the validity still is not a timedelta object, issue a warning.
-        if not isinstance(validity, timedelta):
-            warn('EASYJWT_TOKEN_VALIDITY must be an int, a string castable to an int, or a datetime.timedelta.')
-            return None
+                return None
 
-        return validity
+        return timedelta(seconds=validity)
 
     @classmethod
     def _get_config_expiration_date(cls) -> Optional[datetime]:
@@ -191,8 +257,9 @@ class FlaskEasyJWT(EasyJWT):
         if validity is None:
             return None
 
-        # The expiration date of the token is the given amount of time from now.
-        return datetime.utcnow().replace(microsecond=0) + validity
+        # The expiration date of the token is the given amount of time from now. Compute it on the POSIX timestamp
+        # (truncated to full seconds) so that only a single datetime object has to be created.
+        return datetime.utcfromtimestamp(int(time()) + validity.total_seconds())
 
     @staticmethod
     def _get_config_key() -> str:
@@ -203,17 +270,43 @@ class FlaskEasyJWT(EasyJWT):
             :raise EasyJWTError: If there is no key defined in the application's configuration.
         """
 
+        # Resolve the application proxy only once for both lookups.
+        config = current_app.config
+
         # If there is a key defined in the EasyJWT configuration key, use this. Otherwise, fall back to the app' secret
         # key.
-        key: Optional[str] = current_app.config.get('EASYJWT_KEY', None)
+        key: Optional[str] = config.get('EASYJWT_KEY', None)
         if key is not None:
             return key
 
         # Fall back to the application's secret key.
-        key = current_app.config.get('SECRET_KEY', None)
+        key = config.get('SECRET_KEY', None)
         if key is not None:
             return key
 
-        raise EasyJWTError('No key set for encrypting tokens. Set EASYJWT_KEY or SECRET_KEY.')
+        raise EasyJWTError(_NO_KEY_MESSAGE)
+
+    @staticmethod
+    def _warn_once(message: str, value: Any) -> None:
+        """
+            Issue a warning with the given message unless it has already been issued for the given configuration value
+            in the current Flask app.
+
+            This method must be executed within the application context.
+
+            :param message: The message of the warning.
+            :param value: The configuration value causing the warning. If the configuration is changed to another value
+                          causing the same warning, the warning will be issued again.
+        """
+
+        # Use the value's representation as it might not be hashable.
+        warning = (message, repr(value))
+        issued_warnings: Set[Tuple[str, str]] = current_app.extensions.setdefault('easyjwt_issued_warnings', set())
+        if warning in issued_warnings:
+            return
+
+        # Only remember the warning once it has been issued: if warnings are turned into errors, each call must fail.
+        warn(message)
+        issued_warnings.add(warning)
 
     # endregion
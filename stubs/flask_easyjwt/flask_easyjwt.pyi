@@ -4,7 +4,7 @@
 
 from datetime import datetime, timedelta
 from easyjwt import EasyJWT
-from typing import Any, Iterable, Optional, Type, TypeVar, Union
+from typing import Any, Iterable, List, Optional, Type, TypeVar, Union
 
 FlaskEasyJWTClass = TypeVar('FlaskEasyJWTClass', bound='FlaskEasyJWT', covariant=True)
 
@@ -14,5 +14,7 @@ class FlaskEasyJWT(EasyJWT):
     def create(self, issued_at: Optional[datetime]=...) -> str: ...
     @classmethod
     def verify(cls: Type[FlaskEasyJWTClass], token: str, key: Optional[str]=..., issuer: Optional[str]=..., audience: Optional[Union[Iterable[str], str]]=...) -> FlaskEasyJWTClass: ...
+    @classmethod
+    def verify_many(cls: Type[FlaskEasyJWTClass], tokens: Iterable[str], key: Optional[str]=..., issuer: Optional[str]=..., audience: Optional[Union[Iterable[str], str]]=...) -> List[FlaskEasyJWTClass]: ...
     @staticmethod
     def get_validity() -> Optional[timedelta]: ...
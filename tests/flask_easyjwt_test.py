@@ -5,8 +5,12 @@ from unittest import TestCase
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
+from base64 import urlsafe_b64decode
+from base64 import urlsafe_b64encode
 from datetime import datetime
 from datetime import timedelta
+from warnings import catch_warnings
+from warnings import simplefilter
 
 from flask import Flask
 
@@ -20,31 +24,41 @@ class FlaskEasyJWTTest(TestCase):
 
     # region Test Setup
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """
-            Prepare the test cases.
+            Prepare the application shared by all test cases.
         """
 
-        self.easyjwt_key = 'abcdefghijklmnopqrstuvwxyz'
-        self.secret_key = self.easyjwt_key[::-1]
-        self.validity = 15  # In minutes.
+        cls.easyjwt_key = 'abcdefghijklmnopqrstuvwxyz'
+        cls.secret_key = cls.easyjwt_key[::-1]
+        cls.validity = 15  # In minutes.
 
-        self.app = Flask(__name__)
-        self.app.config['EASYJWT_KEY'] = self.easyjwt_key
-        self.app.config['SECRET_KEY'] = self.secret_key
+        cls.custom_validity = cls.validity + 15  # In minutes.
+        cls.custom_key = cls.easyjwt_key + cls.secret_key
 
-        self.custom_validity = self.validity + 15  # In minutes.
-        self.custom_key = self.easyjwt_key + self.secret_key
+        cls.app = Flask(__name__)
+        cls.app_context = cls.app.app_context()
+        cls.app_context.push()
 
-        self.app_context = self.app.app_context()
-        self.app_context.push()
+    @classmethod
+    def tearDownClass(cls):
+        """
+            Clean up after all test cases.
+        """
+
+        cls.app_context.pop()
 
-    def tearDown(self):
+    def setUp(self):
         """
-            Clean up after each test case.
+            Prepare the test cases.
         """
 
-        self.app_context.pop()
+        # Reset the configuration and the state of the shared application that previous test cases might have changed.
+        self.app.config.pop('EASYJWT_TOKEN_VALIDITY', None)
+        self.app.config['EASYJWT_KEY'] = self.easyjwt_key
+        self.app.config['SECRET_KEY'] = self.secret_key
+        self.app.extensions.clear()
 
     # endregion
 
@@ -141,6 +155,23 @@ class FlaskEasyJWTTest(TestCase):
         verified_easyjwt = FlaskEasyJWT.verify(token, self.custom_key)
         self.assertIsNotNone(verified_easyjwt)
 
+    def test_verify_custom_key_no_app(self):
+        """
+            Test verifying a token with a custom key outside an app context.
+
+            Expected Result: The token is verified without accessing the application's configuration.
+        """
+
+        easyjwt = FlaskEasyJWT(self.custom_key)
+        token = easyjwt.create()
+
+        self.app_context.pop()
+        # Push the app context again afterwards, even if the test fails, so that the following test cases
+        # and the class tear down method can use it.
+        self.addCleanup(self.app_context.push)
+        verified_easyjwt = FlaskEasyJWT.verify(token, self.custom_key)
+        self.assertIsNotNone(verified_easyjwt)
+
     def test_verify_default_key(self):
         """
             Test verifying a token created with the default key.
@@ -158,6 +189,93 @@ class FlaskEasyJWTTest(TestCase):
         verified_easyjwt = FlaskEasyJWT.verify(token)
         self.assertIsNotNone(verified_easyjwt)
 
+    def test_verify_many_custom_key(self):
+        """
+            Test verifying multiple tokens created with a custom key.
+
+            Expected Result: The tokens can be verified with the custom key, but not with the extension's key.
+        """
+
+        tokens = [FlaskEasyJWT(self.custom_key).create() for _ in range(3)]
+
+        with self.assertRaises(InvalidSignatureError):
+            verified_easyjwts = FlaskEasyJWT.verify_many(tokens)
+            self.assertIsNone(verified_easyjwts)
+
+        verified_easyjwts = FlaskEasyJWT.verify_many(tokens, self.custom_key)
+        self.assertEqual(len(tokens), len(verified_easyjwts))
+
+    def test_verify_many_default_key(self):
+        """
+            Test verifying multiple tokens created with the default key.
+
+            Expected Result: All tokens are verified in the given order.
+        """
+
+        self.app.config['EASYJWT_TOKEN_VALIDITY'] = timedelta(minutes=self.validity)
+
+        easyjwts = [FlaskEasyJWT() for _ in range(3)]
+        for index, easyjwt in enumerate(easyjwts):
+            easyjwt.subject = str(index)
+        tokens = [easyjwt.create() for easyjwt in easyjwts]
+
+        verified_easyjwts = FlaskEasyJWT.verify_many(tokens)
+        self.assertEqual([easyjwt.subject for easyjwt in easyjwts],
+                         [verified_easyjwt.subject for verified_easyjwt in verified_easyjwts])
+
+    def test_verify_many_invalid_token(self):
+        """
+            Test verifying multiple tokens if one of them is not valid.
+
+            Expected Result: The verification fails.
+        """
+
+        tokens = [FlaskEasyJWT().create(), FlaskEasyJWT(self.custom_key).create()]
+
+        with self.assertRaises(InvalidSignatureError):
+            verified_easyjwts = FlaskEasyJWT.verify_many(tokens)
+            self.assertIsNone(verified_easyjwts)
+
+    def test_verify_many_key_lookup(self):
+        """
+            Test the key lookup when verifying multiple tokens.
+
+            Expected Result: The key is looked up in the configuration exactly once if no key is given, and not at all
+                             if a key is given.
+        """
+
+        tokens = [FlaskEasyJWT().create() for _ in range(3)]
+
+        with patch.object(FlaskEasyJWT, '_get_config_key', wraps=FlaskEasyJWT._get_config_key) as mock_get_config_key:
+            verified_easyjwts = FlaskEasyJWT.verify_many(tokens)
+            self.assertEqual(len(tokens), len(verified_easyjwts))
+            mock_get_config_key.assert_called_once()
+
+            mock_get_config_key.reset_mock()
+            verified_easyjwts = FlaskEasyJWT.verify_many(tokens, self.easyjwt_key)
+            self.assertEqual(len(tokens), len(verified_easyjwts))
+            mock_get_config_key.assert_not_called()
+
+    def test_verify_signature_differs_in_last_byte(self):
+        """
+            Test verifying a token whose signature only differs from the correct one in the last byte.
+
+            Expected Result: The token is rejected.
+        """
+
+        token = FlaskEasyJWT().create()
+        signing_input, signature = token.rsplit('.', 1)
+
+        # Flip the bits of the signature's last byte. Do not just change the last character, as it contains padding
+        # bits that are ignored when decoding.
+        signature_bytes = bytearray(urlsafe_b64decode(signature + '=' * (-len(signature) % 4)))
+        signature_bytes[-1] ^= 0xFF
+        forged_signature = urlsafe_b64encode(bytes(signature_bytes)).decode('ascii').rstrip('=')
+
+        with self.assertRaises(InvalidSignatureError):
+            verified_easyjwt = FlaskEasyJWT.verify(f'{signing_input}.{forged_signature}')
+            self.assertIsNone(verified_easyjwt)
+
     # endregion
 
     # region Configuration Values
@@ -200,6 +318,9 @@ class FlaskEasyJWTTest(TestCase):
         """
 
         self.app_context.pop()
+        # Push the app context again afterwards, even if the test fails, so that the following test cases
+        # and the class tear down method can use it.
+        self.addCleanup(self.app_context.push)
         with self.assertRaises(RuntimeError) as exception_cm:
             validity = FlaskEasyJWT.get_validity()
             self.assertIsNone(validity)
@@ -208,9 +329,6 @@ class FlaskEasyJWTTest(TestCase):
         self.assertIn(message, str(exception_cm.exception))
         mock_warn.assert_not_called()
 
-        # Push the app context again so that the tear down method will have something to pop.
-        self.app_context.push()
-
     @patch('flask_easyjwt.flask_easyjwt.warn')
     def test_get_validity_none(self, mock_warn: MagicMock):
         """
@@ -240,6 +358,71 @@ class FlaskEasyJWTTest(TestCase):
         self.assertEqual(timedelta(seconds=int(self.app.config['EASYJWT_TOKEN_VALIDITY'])), validity)
         mock_warn.assert_not_called()
 
+    @patch('flask_easyjwt.flask_easyjwt.warn')
+    def test_get_validity_string_signed(self, mock_warn: MagicMock):
+        """
+            Test getting the validity if it is configured as a string with a sign and surrounding whitespace.
+
+            Expected Result: The token's validity as parsed by `int()`. No warning is issued.
+        """
+
+        for configured_validity in [f' +{self.validity * 60} ', f'-{self.validity * 60}']:
+            self.app.config['EASYJWT_TOKEN_VALIDITY'] = configured_validity
+
+            validity = FlaskEasyJWT.get_validity()
+            self.assertEqual(timedelta(seconds=int(configured_validity)), validity)
+
+        mock_warn.assert_not_called()
+
+    @patch('flask_easyjwt.flask_easyjwt.warn')
+    def test_get_validity_string_underscores(self, mock_warn: MagicMock):
+        """
+            Test getting the validity if it is configured as a string with underscores between the digits.
+
+            Expected Result: The token's validity as parsed by `int()`. No warning is issued.
+        """
+
+        self.app.config['EASYJWT_TOKEN_VALIDITY'] = '1_000'
+
+        validity = FlaskEasyJWT.get_validity()
+        self.assertEqual(timedelta(seconds=1000), validity)
+        mock_warn.assert_not_called()
+
+    @patch('flask_easyjwt.flask_easyjwt.warn')
+    def test_get_validity_string_non_decimal_digit(self, mock_warn: MagicMock):
+        """
+            Test getting the validity if it is configured as a string of a digit that is not a decimal digit.
+
+            Expected Result: `None` is returned. A warning is issued.
+        """
+
+        # A superscript two is a digit, but cannot be parsed by int().
+        self.app.config['EASYJWT_TOKEN_VALIDITY'] = '\u00b2'
+
+        self.assertIsNone(FlaskEasyJWT.get_validity())
+        mock_warn.assert_called_once()
+
+    @patch('flask_easyjwt.flask_easyjwt.warn')
+    def test_get_validity_string_repeated(self, mock_warn: MagicMock):
+        """
+            Test getting the validity repeatedly if it is configured as a string that can be parsed to an integer.
+
+            Expected Result: The token's validity as defined in the configuration, converted only once. No warning is
+                             issued.
+        """
+
+        # Use a value no other test uses so that it has not been converted before.
+        self.app.config['EASYJWT_TOKEN_VALIDITY'] = str(self.validity * 60 + 1)
+
+        validity = FlaskEasyJWT.get_validity()
+        hits = FlaskEasyJWT._convert_validity.cache_info().hits
+        repeated_validity = FlaskEasyJWT.get_validity()
+
+        self.assertEqual(timedelta(seconds=int(self.app.config['EASYJWT_TOKEN_VALIDITY'])), validity)
+        self.assertEqual(validity, repeated_validity)
+        self.assertEqual(hits + 1, FlaskEasyJWT._convert_validity.cache_info().hits)
+        mock_warn.assert_not_called()
+
     @patch('flask_easyjwt.flask_easyjwt.warn')
     def test_get_config_expiration_date_string_unparsable(self, mock_warn: MagicMock):
         """
@@ -257,6 +440,52 @@ class FlaskEasyJWTTest(TestCase):
         warning = 'must be an int, a string castable to an int, or a datetime.timedelta'
         self.assertIn(warning, mock_warn.call_args_list[0][0][0])
 
+    @patch('flask_easyjwt.flask_easyjwt.warn')
+    def test_get_validity_string_unparsable_repeated(self, mock_warn: MagicMock):
+        """
+            Test getting the validity repeatedly if it is configured as a string that cannot be parsed to an integer.
+
+            Expected Result: `None` is returned each time. The warning is issued only once.
+        """
+
+        self.app.config['EASYJWT_TOKEN_VALIDITY'] = '15 minutes'
+
+        self.assertIsNone(FlaskEasyJWT.get_validity())
+        self.assertIsNone(FlaskEasyJWT.get_validity())
+        mock_warn.assert_called_once()
+
+    def test_get_validity_string_unparsable_warnings_as_errors(self):
+        """
+            Test getting the validity repeatedly if it is configured as an unparsable string and warnings are errors.
+
+            Expected Result: Each call raises the warning.
+        """
+
+        self.app.config['EASYJWT_TOKEN_VALIDITY'] = '15 minutes'
+
+        with catch_warnings():
+            simplefilter('error')
+
+            with self.assertRaises(UserWarning):
+                FlaskEasyJWT.get_validity()
+
+            with self.assertRaises(UserWarning):
+                FlaskEasyJWT.get_validity()
+
+    @patch('flask_easyjwt.flask_easyjwt.warn')
+    def test_get_validity_unparsable_changed(self, mock_warn: MagicMock):
+        """
+            Test getting the validity repeatedly if it is changed from one invalid value to another.
+
+            Expected Result: `None` is returned each time. The warning is issued once for each value.
+        """
+
+        for configured_validity in ['15 minutes', '15 minutes', ['15'], ['15']]:
+            self.app.config['EASYJWT_TOKEN_VALIDITY'] = configured_validity
+            self.assertIsNone(FlaskEasyJWT.get_validity())
+
+        self.assertEqual(2, mock_warn.call_count)
+
     def test_get_expiration_date_no_validity(self):
         """
             Test getting the expiration date if no validity is defined in the application's configuration.
@@ -309,6 +538,9 @@ class FlaskEasyJWTTest(TestCase):
         """
 
         self.app_context.pop()
+        # Push the app context again afterwards, even if the test fails, so that the following test cases
+        # and the class tear down method can use it.
+        self.addCleanup(self.app_context.push)
         with self.assertRaises(RuntimeError) as exception_cm:
             key = FlaskEasyJWT._get_config_key()
             self.assertIsNone(key)
@@ -316,9 +548,6 @@ class FlaskEasyJWTTest(TestCase):
         message = 'Working outside of application context.'
         self.assertIn(message, str(exception_cm.exception))
 
-        # Push the app context again so that the tear down method will have something to pop.
-        self.app_context.push()
-
     def test_get_config_key_none(self):
         """
             Test getting the key if none is set.
@@ -23,7 +23,8 @@ class IntegrationTest(TestCase):
 
     # region Flask App
 
-    def _create_app(self) -> Flask:
+    @classmethod
+    def _create_app(cls) -> Flask:
         """
             Create a Flask test application.
 
@@ -32,13 +33,13 @@ class IntegrationTest(TestCase):
 
         application = Flask(__name__)
         application.config.from_mapping(
-            EASYJWT_KEY=self.easyjwt_key,
-            EASYJWT_TOKEN_VALIDITY=self.validity,
-            SECRET_KEY=self.secret_key,
+            EASYJWT_KEY=cls.easyjwt_key,
+            EASYJWT_TOKEN_VALIDITY=cls.validity,
+            SECRET_KEY=cls.secret_key,
         )
 
-        application.add_url_rule('/get_token/<int:user_id>', view_func=self._get_token)
-        application.add_url_rule('/validate_user/<string:token>', view_func=self._validate_user)
+        application.add_url_rule('/get_token/<int:user_id>', view_func=cls._get_token)
+        application.add_url_rule('/validate_user/<string:token>', view_func=cls._validate_user)
 
         return application
 
@@ -77,29 +78,18 @@ class IntegrationTest(TestCase):
 
     # region Test Setup
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """
-            Prepare the test cases.
+            Prepare the application and the test client shared by all test cases.
         """
 
-        self.easyjwt_key = 'abcdefghijklmnopqrstuvwxyz'
-        self.secret_key = self.easyjwt_key[::-1]
-        self.validity = timedelta(minutes=5)
+        cls.easyjwt_key = 'abcdefghijklmnopqrstuvwxyz'
+        cls.secret_key = cls.easyjwt_key[::-1]
+        cls.validity = timedelta(minutes=5)
 
-        self.app = self._create_app()
-        self.client = self.app.test_client()
-        self.app_context = self.app.app_context()
-        self.app_context.push()
-        self.request_context = self.app.test_request_context()
-        self.request_context.push()
-
-    def tearDown(self):
-        """
-            Clean up after each test case.
-        """
-
-        self.request_context.pop()
-        self.app_context.pop()
+        cls.app = cls._create_app()
+        cls.client = cls.app.test_client()
 
     # endregion
 
@@ -110,10 +100,12 @@ class IntegrationTest(TestCase):
             Expected Result: The token is rejected.
         """
 
-        # Use a different key for creating the token then for validating it.
-        token_object = AccountValidationToken(self.easyjwt_key[::-1])
-        token_object.user_id = 42
-        token = token_object.create()
+        # Use a different key for creating the token then for validating it. The token is created outside a request,
+        # but still needs the application's configuration for its validity.
+        with self.app.app_context():
+            token_object = AccountValidationToken(self.easyjwt_key[::-1])
+            token_object.user_id = 42
+            token = token_object.create()
 
         response = self.client.get(f'/validate_user/{token}')
         validated_user = response.get_data(as_text=True)